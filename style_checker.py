@@ -2,285 +2,525 @@
 
 import re
 import os
+import json
+import hashlib
 import sys
 import subprocess
+from array import array
+from bisect import bisect_right
 from pathlib import Path
 
+# Per-line rules share one alternation so each line is scanned once; the
+# named group that matched tells us which rule fired.
+_COMBINED = re.compile(
+    rb'(?P<CAPS>^\s*#define)'
+    rb'|(?P<INFIN>(?i:while\s*\(\s*(?:1|true)\s*\)|for\s*\(\s*;\s*;\s*\)))'
+    rb'|(?P<RETV>\b(?:scanf|malloc|fopen)(?=\s*\([^)]*\)\s*;))'
+)
+
+# Most lines have no digits at all, so MAGIC only runs where _DIGIT_RE hits
+_DIGIT_RE = re.compile(rb'\d')
+_MAGIC_RE = re.compile(rb'\b(?!0\b|1\b|-1\b)\d+\b')
+
+# Minimal C lexer for the structural checks. Comments, literals and
+# preprocessor lines are matched whole, so braces and keywords inside them
+# are never mistaken for code; everything else that isn't listed is skipped.
+_TOKEN_RE = re.compile(rb'''
+    (?P<comment>//[^\n]*|/\*.*?(?:\*/|\Z))
+  | (?P<string>"(?:\\.|[^"\\\n])*"?)
+  | (?P<char>'(?:\\.|[^'\\\n])*'?)
+  | (?P<preproc>^[ \t]*\#(?:\\\n|[^\n])*)
+  | (?P<brace_open>\{)
+  | (?P<brace_close>\})
+  | (?P<keyword>\b(?:goto|continue|break|switch|for|while|do)\b)
+  | (?P<code>[();])
+  | (?P<newline>\n)
+''', re.VERBOSE | re.DOTALL | re.MULTILINE)
+
+# Matched against lowercased lines, so no IGNORECASE needed
+_TEST_FUNC_RE = re.compile(rb'^\w*\s*test\w*\s*\([^)]*\)\s*$')
+_FUNC_DEF_RE = re.compile(rb'^\w+\s+\w+\s*\([^)]*\)\s*$')
+_RETV_GUARD_RE = re.compile(rb'(?:=|if|while|return).*(?:scanf|malloc|fopen)')
+_CTRL_RE = re.compile(rb'\b(if|else|for|while)\s*\([^)]*\)\s*$')
+
+# Issue kinds. Issues are stored as (kind, line, extra, limit) int records and
+# only turned into messages when they're reported; what extra holds depends
+# on the kind (a column, a length, ...), see StyleChecker._format_issue.
+# limit is the maximum an LLEN/FLEN check was run with, 0 otherwise.
+(_TABS, _LLEN, _MAGIC, _FLEN, _GOTO, _BREAK, _INFIN, _CAPS, _RETV, _BRACE,
+ _FLAGS, _FLAGS_OUTPUT, _FLAGS_ERROR) = range(13)
+_ERROR_KINDS = frozenset((_TABS, _GOTO, _INFIN, _CAPS, _FLAGS, _FLAGS_OUTPUT, _FLAGS_ERROR))
+
+_FORBIDDEN_KEYWORDS = (b'goto', b'continue')
+_WORD_RE = re.compile(rb'\w+')
+
+# Bump whenever rules or messages change so cached results are recomputed
+_CACHE_VERSION = 1
+
+# Importing numpy costs tens of milliseconds, more than the plain LLEN loop
+# takes on any realistic source file, so only reach for it on huge inputs
+_NUMPY_MIN_LINES = 50_000
+
+# Flags required of every submission
+_GCC_FLAGS = ['-fsyntax-only', '-Wall', '-Wextra', '-Wfloat-equal', '-Wvla', '-pedantic', '-std=c99']
+
+def _text(token):
+    """Decode a matched source token for display"""
+    return token.decode('latin-1', 'replace')
+
+def _format_diagnostic(diagnostic):
+    """Render a gcc JSON diagnostic and its notes the way gcc prints them as text"""
+    message = f"{diagnostic['kind']}: {diagnostic['message']}"
+    if diagnostic.get('option'):
+        message += f" [{diagnostic['option']}]"
+
+    locations = diagnostic.get('locations')
+    if locations and 'caret' in locations[0]:
+        caret = locations[0]['caret']
+        message = f"{caret['file']}:{caret['line']}:{caret['column']}: {message}"
+
+    lines = [message]
+    lines.extend(_format_diagnostic(child) for child in diagnostic.get('children', ()))
+    return '\n'.join(lines)
+
 class StyleChecker:
     def __init__(self, filename):
         self.filename = filename
-        self.errors = []
-        self.warnings = []
-        self.content = ""
+        self._raw = array('i')  # Issues found so far, as flat (kind, line, extra, limit) records
+        self.content = b""
         self.lines = []
-        self.test_function_lines = set()  # Track lines that are in test functions
+        # Test functions as sorted, non-overlapping (start, end) line ranges
+        self._test_starts = array('i')
+        self._test_ends = array('i')
+        self._issues = None  # Per-rule results of the single-pass scan
+        self._compilation = None  # (compiled, compiler output) once gcc has run
+        self._batch_compilation = None  # Result from check_all_batch for the next load
+        # Per-line facts shared by the checks, filled in by load_file
+        self._stripped = []
+        self._code_only = []  # Line with any // comment removed
+        self._has_tab = []
+        self._has_digit = []
+        self._brace_delta = []  # Opening minus closing braces on the line
+        self._has_close = []  # Line closes a brace in code
+        self._lens = array('i')
+        # Keyword findings from the lexer
+        self._forbidden = []  # (line, keyword) for each goto/continue
+        self._stray_breaks = []  # Lines with a break that doesn't exit a switch
 
     def load_file(self):
         """Load the C file content"""
+        # Results from an earlier load describe the old content
+        self._raw = array('i')
+        self._issues = None
+        self._compilation, self._batch_compilation = self._batch_compilation, None
+
         try:
-            with open(self.filename, 'r') as f:
-                self.content = f.read()
-                self.lines = self.content.splitlines()
-            self._identify_test_functions()
-            return True
+            fd = os.open(self.filename, os.O_RDONLY)
+            try:
+                size = os.fstat(fd).st_size
+                chunks = []
+                received = 0
+                # fstat already told us the size, so a complete read needs no
+                # extra call to see EOF. Short reads (NFS) keep looping, and so
+                # do files that report no size (pipes, /proc)
+                while size == 0 or received < size:
+                    chunk = os.read(fd, max(size - received, 1 << 16))
+                    if not chunk:
+                        break
+                    chunks.append(chunk)
+                    received += len(chunk)
+            finally:
+                os.close(fd)
         except FileNotFoundError:
             print(f"Error: File {self.filename} not found")
             return False
+        except OSError as e:
+            print(f"Error: Could not read {self.filename}: {e.strerror}")
+            return False
+
+        # Everything downstream works on bytes, so skip decoding entirely
+        self.content = b''.join(chunks)
+        self.lines = self.content.splitlines()
+        self._stripped = [l.strip() for l in self.lines]
+        self._code_only = [l.split(b'//', 1)[0] for l in self.lines]
+        self._has_tab = [b'\t' in l for l in self.lines]
+        self._has_digit = [_DIGIT_RE.search(l) is not None for l in self.lines]
+        # Line lengths are in characters, so multi-byte UTF-8 counts once
+        self._lens = array('i', [
+            len(l) if l.isascii() else len(l.decode('utf-8', 'replace'))
+            for l in self.lines
+        ])
+        self._analyze_structure()
+        self._identify_test_functions()
+        return True
+
+    def _lex(self):
+        """Yield (line_no, kind, text) for each structural token in the file"""
+        # self.lines also splits on a bare \r; lex the same lines so token
+        # line numbers always agree with them
+        source = b'\n'.join(self.lines) if b'\r' in self.content else self.content
+
+        line_no = 1
+        for m in _TOKEN_RE.finditer(source):
+            kind = m.lastgroup
+            if kind == 'newline':
+                line_no += 1
+                continue
+
+            text = m.group()
+            yield line_no, kind, text
+            # Block comments, literals and preprocessor lines can span lines
+            line_no += text.count(b'\n')
+
+    def _analyze_structure(self):
+        """Collect brace and keyword facts from a single pass of the lexer"""
+        self._brace_delta = [0] * len(self.lines)
+        self._has_close = [False] * len(self.lines)
+        self._forbidden = []
+        self._stray_breaks = []
+
+        blocks = []  # 'switch', 'loop' or 'block' for each open brace
+        pending = None  # Statement whose body hasn't started yet
+        parens = 0
+
+        for line_no, kind, text in self._lex():
+            if kind == 'brace_open':
+                self._brace_delta[line_no - 1] += 1
+                blocks.append(pending or 'block')
+                pending = None
+            elif kind == 'brace_close':
+                self._brace_delta[line_no - 1] -= 1
+                self._has_close[line_no - 1] = True
+                if blocks:
+                    blocks.pop()
+            elif kind == 'keyword':
+                if text in (b'goto', b'continue'):
+                    self._forbidden.append((line_no, text))
+                elif text == b'break':
+                    # break exits the innermost loop or switch; only the
+                    # latter is allowed. A loop with a brace-less body is
+                    # still pending when its break shows up.
+                    innermost = pending if pending == 'loop' else next(
+                        (b for b in reversed(blocks) if b != 'block'), None)
+                    if innermost != 'switch':
+                        self._stray_breaks.append(line_no)
+                elif text == b'switch':
+                    pending = 'switch'
+                else:
+                    pending = 'loop'
+            elif kind == 'code':
+                if text == b'(':
+                    parens += 1
+                elif text == b')':
+                    parens = max(parens - 1, 0)
+                elif parens == 0:
+                    pending = None  # A brace-less body ended
 
     def _identify_test_functions(self):
         """Identify lines that belong to test functions"""
-        in_test_function = False
+        intervals = []
+        start = None  # First line of the test function we're in, if any
         brace_count = 0
 
-        for i, line in enumerate(self.lines, 1):
-            stripped = line.strip()
-
-            # Look for test function definitions
-            if re.match(r'^\w*\s*test\w*\s*\([^)]*\)\s*$', stripped, re.IGNORECASE):
-                in_test_function = True
+        for i, stripped in enumerate(self._stripped, 1):
+            # Look for test function definitions; the substring test rules
+            # out almost every line before the regex runs
+            low = stripped.lower()
+            if b'test' in low and _TEST_FUNC_RE.match(low):
+                if start is not None:
+                    intervals.append((start, i - 1))
+                start = i
                 brace_count = 0
-                self.test_function_lines.add(i)
                 continue
 
-            if in_test_function:
-                self.test_function_lines.add(i)
-                brace_count += stripped.count('{') - stripped.count('}')
+            if start is not None:
+                brace_count += self._brace_delta[i - 1]
 
                 # Function ended
-                if brace_count == 0 and '}' in stripped:
-                    in_test_function = False
+                if brace_count == 0 and self._has_close[i - 1]:
+                    intervals.append((start, i))
+                    start = None
+
+        # An unterminated test function runs to the end of the file
+        if start is not None:
+            intervals.append((start, len(self.lines)))
+
+        self._test_starts = array('i', [s for s, _ in intervals])
+        self._test_ends = array('i', [e for _, e in intervals])
 
     def _is_in_test_function(self, line_num):
         """Check if a line is inside a test function"""
-        return line_num in self.test_function_lines
+        idx = bisect_right(self._test_starts, line_num) - 1
+        return idx >= 0 and line_num <= self._test_ends[idx]
+
+    def _format_issue(self, kind, line, extra, limit):
+        """Build the message for one recorded issue"""
+        if kind == _TABS:
+            return f"TABS violation: Line {line}: Contains tab character"
+        if kind == _LLEN:
+            return f"LLEN warning: Line {line}: {extra} chars (max {limit})"
+        if kind == _MAGIC:
+            number = _WORD_RE.match(self.lines[line - 1], extra).group()
+            return f"MAGIC warning: Line {line}: Magic number '{_text(number)}'"
+        if kind == _FLEN:
+            name = self._stripped[line - 1].split(b'(')[0].strip().split()[-1]
+            return f"FLEN warning: Function '{_text(name)}': {extra} lines (max {limit})"
+        if kind == _GOTO:
+            return f"GOTO violation: Line {line}: Forbidden keyword '{_text(_FORBIDDEN_KEYWORDS[extra])}'"
+        if kind == _BREAK:
+            return f"GOTO warning: Line {line}: 'break' outside a switch statement"
+        if kind == _INFIN:
+            return f"INFIN violation: Line {line}: Infinite loop pattern"
+        if kind == _CAPS:
+            name = self._stripped[line - 1].split()[1]
+            return f"CAPS violation: Line {line}: Constant '{_text(name)}' should be uppercase"
+        if kind == _RETV:
+            func = _WORD_RE.match(self.lines[line - 1], extra).group()
+            return f"RETV warning: Line {line}: Unused return value from '{_text(func)}'"
+        if kind == _BRACE:
+            structure = _CTRL_RE.match(self._stripped[line - 1]).group(1)
+            return f"BRACE warning: Line {line}: {_text(structure)} statement might be missing braces"
+        if kind == _FLAGS:
+            return "FLAGS violation: Compilation failed with required flags"
+        if kind == _FLAGS_OUTPUT:
+            return f"Compiler output: {self._compilation[1]}"
+        return "FLAGS violation: Could not compile with required flags"
+
+    def _formatted(self, errors):
+        """Messages for the recorded errors (or warnings), in the order found"""
+        raw = self._raw
+        return [
+            self._format_issue(kind, line, extra, limit)
+            for kind, line, extra, limit in zip(raw[0::4], raw[1::4], raw[2::4], raw[3::4])
+            if (kind in _ERROR_KINDS) == errors
+        ]
+
+    @property
+    def errors(self):
+        """Error messages for the issues found so far; a new list on every access"""
+        return self._formatted(True)
+
+    @property
+    def warnings(self):
+        """Warning messages for the issues found so far; a new list on every access"""
+        return self._formatted(False)
+
+    def _scan(self):
+        """Run every per-line rule in a single pass over the file"""
+        issues = {rule: array('i') for rule in ('TABS', 'MAGIC', *_COMBINED.groupindex)}
+        per_line = zip(self.lines, self._stripped, self._code_only, self._has_tab, self._has_digit)
+
+        for i, (line, stripped, code, has_tab, has_digit) in enumerate(per_line, 1):
+            if has_tab:
+                issues['TABS'].extend((_TABS, i, 0, 0))
+
+            in_test = self._is_in_test_function(i)
+
+            # Skip test functions, #define lines and comments
+            if has_digit and not (in_test or stripped.startswith(b'#define') or stripped.startswith(b'//')):
+                for match in _MAGIC_RE.finditer(line):
+                    # Skip common non-magic numbers
+                    if match.group() not in [b'2', b'10', b'100']:  # Add more exceptions as needed
+                        issues['MAGIC'].extend((_MAGIC, i, match.start(), 0))
+
+            for m in _COMBINED.finditer(line):
+                rule = m.lastgroup
+                if rule == 'CAPS':
+                    # Extract the constant name
+                    parts = stripped.split()
+                    if len(parts) >= 2 and not parts[1].isupper():
+                        issues[rule].extend((_CAPS, i, 0, 0))
+                elif rule == 'INFIN':
+                    issues[rule].extend((_INFIN, i, 0, 0))
+                elif rule == 'RETV':
+                    # Skip test functions and calls inside comments
+                    if in_test or m.start() >= len(code):
+                        continue
+                    # Check if it's assigned or used in condition
+                    if not _RETV_GUARD_RE.search(line, 0, m.end()):
+                        issues[rule].extend((_RETV, i, m.start(), 0))
+
+        # Keywords come from the lexer, which already skips comments and strings
+        issues['GOTO'] = array('i')
+        for i, keyword in self._forbidden:
+            issues['GOTO'].extend((_GOTO, i, _FORBIDDEN_KEYWORDS.index(keyword), 0))
+        issues['BREAK'] = array('i')
+        for i in self._stray_breaks:
+            issues['BREAK'].extend((_BREAK, i, 0, 0))
+
+        self._issues = issues
+
+    def _scanned(self, rule):
+        """Issue records found for a per-line rule, scanning the file on first use"""
+        if self._issues is None:
+            self._scan()
+        return self._issues[rule]
 
     def check_tabs(self):
         """TABS: Check for tab characters"""
-        issues = []
-        for i, line in enumerate(self.lines, 1):
-            if '\t' in line:
-                issues.append(f"Line {i}: Contains tab character")
-
-        if issues:
-            self.errors.extend([f"TABS violation: {issue}" for issue in issues])
+        issues = self._scanned('TABS')
+        self._raw.extend(issues)
         return len(issues) == 0
 
     def check_line_length(self, max_length=60):
         """LLEN: Check line length (skip test functions)"""
-        issues = []
-        for i, line in enumerate(self.lines, 1):
-            if self._is_in_test_function(i):
-                continue  # Skip test functions
-
-            if len(line) > max_length:
-                issues.append(f"Line {i}: {len(line)} chars (max {max_length})")
-
-        if issues:
-            self.warnings.extend([f"LLEN warning: {issue}" for issue in issues])
-        return len(issues) == 0
+        np = None
+        if len(self._lens) > _NUMPY_MIN_LINES:
+            try:
+                import numpy as np
+            except ImportError:
+                pass
+
+        if np is not None:
+            too_long = np.asarray(self._lens) > max_length
+            for start, end in zip(self._test_starts, self._test_ends):
+                too_long[start - 1:end] = False  # Skip test functions
+            long_lines = (np.flatnonzero(too_long) + 1).tolist()
+        else:
+            long_lines = [
+                i for i, length in enumerate(self._lens, 1)
+                if length > max_length and not self._is_in_test_function(i)
+            ]
+
+        for i in long_lines:
+            self._raw.extend((_LLEN, i, self._lens[i - 1], max_length))
+        return len(long_lines) == 0
 
     def check_magic_numbers(self):
         """MAGIC: Check for magic numbers (skip test functions)"""
-        issues = []
-        # Look for numeric literals that aren't 0, 1, -1
-        magic_pattern = r'\b(?!0\b|1\b|-1\b)\d+\b'
-
-        for i, line in enumerate(self.lines, 1):
-            if self._is_in_test_function(i):
-                continue  # Skip test functions
-
-            # Skip #define lines and comments
-            if line.strip().startswith('#define') or line.strip().startswith('//'):
-                continue
-
-            matches = re.findall(magic_pattern, line)
-            for match in matches:
-                # Skip common non-magic numbers
-                if match not in ['2', '10', '100']:  # Add more exceptions as needed
-                    issues.append(f"Line {i}: Magic number '{match}'")
-
-        if issues:
-            self.warnings.extend([f"MAGIC warning: {issue}" for issue in issues])
+        issues = self._scanned('MAGIC')
+        self._raw.extend(issues)
         return len(issues) == 0
 
     def check_function_length(self, max_lines=20):
         """FLEN: Check function length (skip test functions)"""
-        issues = []
+        n = 0
         in_function = False
         function_start = 0
-        function_name = ""
+        function_name = b""
         brace_count = 0
 
-        for i, line in enumerate(self.lines, 1):
-            stripped = line.strip()
-
+        for i, stripped in enumerate(self._stripped, 1):
             # Function definition pattern
-            func_pattern = r'^\w+\s+\w+\s*\([^)]*\)\s*$'
-            if re.match(func_pattern, stripped) and not stripped.startswith('//'):
-                function_name = stripped.split('(')[0].strip().split()[-1]
+            if _FUNC_DEF_RE.match(stripped) and not stripped.startswith(b'//'):
+                function_name = stripped.split(b'(')[0].strip().split()[-1]
                 function_start = i
                 in_function = True
                 brace_count = 0
                 continue
 
             if in_function:
-                brace_count += stripped.count('{') - stripped.count('}')
+                brace_count += self._brace_delta[i - 1]
 
                 # Function ended
-                if brace_count == 0 and '}' in stripped:
+                if brace_count == 0 and self._has_close[i - 1]:
                     # Skip test functions
-                    if re.match(r'.*test.*', function_name, re.IGNORECASE):
+                    if b'test' in function_name.lower():
                         in_function = False
                         continue
 
                     function_length = i - function_start + 1
                     if function_length > max_lines:
-                        issues.append(f"Function '{function_name}': {function_length} lines (max {max_lines})")
+                        self._raw.extend((_FLEN, function_start, function_length, max_lines))
+                        n += 1
                     in_function = False
 
-        if issues:
-            self.warnings.extend([f"FLEN warning: {issue}" for issue in issues])
-        return len(issues) == 0
+        return n == 0
 
     def check_forbidden_keywords(self):
         """GOTO: Check for forbidden keywords"""
-        issues = []
-        forbidden = ['goto', 'continue']
-
-        for i, line in enumerate(self.lines, 1):
-            # Skip comments
-            if '//' in line:
-                line = line[:line.index('//')]
-
-            for keyword in forbidden:
-                if re.search(r'\b' + keyword + r'\b', line):
-                    issues.append(f"Line {i}: Forbidden keyword '{keyword}'")
+        issues = self._scanned('GOTO')
+        self._raw.extend(issues)
 
-            # Check for break outside switch
-            if re.search(r'\bbreak\b', line):
-                # This is a simplified check - would need better parsing for switch context
-                self.warnings.append(f"GOTO warning: Line {i}: 'break' found - ensure it's only in switch statements")
+        # Check for break outside switch
+        self._raw.extend(self._scanned('BREAK'))
 
-        if issues:
-            self.errors.extend([f"GOTO violation: {issue}" for issue in issues])
         return len(issues) == 0
 
     def check_infinite_loops(self):
         """INFIN: Check for infinite loops"""
-        issues = []
-        patterns = [
-            r'while\s*\(\s*1\s*\)',
-            r'while\s*\(\s*true\s*\)',
-            r'for\s*\(\s*;\s*;\s*\)'
-        ]
-
-        for i, line in enumerate(self.lines, 1):
-            for pattern in patterns:
-                if re.search(pattern, line, re.IGNORECASE):
-                    issues.append(f"Line {i}: Infinite loop pattern")
-
-        if issues:
-            self.errors.extend([f"INFIN violation: {issue}" for issue in issues])
+        issues = self._scanned('INFIN')
+        self._raw.extend(issues)
         return len(issues) == 0
 
     def check_constants_caps(self):
         """CAPS: Check that #define constants are uppercase"""
-        issues = []
-
-        for i, line in enumerate(self.lines, 1):
-            if line.strip().startswith('#define'):
-                # Extract the constant name
-                parts = line.strip().split()
-                if len(parts) >= 2:
-                    const_name = parts[1]
-                    if not const_name.isupper():
-                        issues.append(f"Line {i}: Constant '{const_name}' should be uppercase")
-
-        if issues:
-            self.errors.extend([f"CAPS violation: {issue}" for issue in issues])
+        issues = self._scanned('CAPS')
+        self._raw.extend(issues)
         return len(issues) == 0
 
     def check_unused_return_values(self):
         """RETV: Check for unused return values (skip test functions)"""
-        issues = []
-        functions_with_returns = ['scanf', 'malloc', 'fopen']  # Removed strcmp - often used in tests
-
-        for i, line in enumerate(self.lines, 1):
-            if self._is_in_test_function(i):
-                continue  # Skip test functions
-
-            # Skip comments
-            if '//' in line:
-                line = line[:line.index('//')]
-
-            for func in functions_with_returns:
-                pattern = rf'\b{func}\s*\([^)]*\)\s*;'
-                if re.search(pattern, line):
-                    # Check if it's assigned or used in condition
-                    if not re.search(rf'=.*{func}|if.*{func}|while.*{func}|return.*{func}', line):
-                        issues.append(f"Line {i}: Unused return value from '{func}'")
-
-        if issues:
-            self.warnings.extend([f"RETV warning: {issue}" for issue in issues])
+        issues = self._scanned('RETV')
+        self._raw.extend(issues)
         return len(issues) == 0
 
     def check_braces(self):
         """BRACE: Basic check for missing braces"""
-        issues = []
-        control_structures = ['if', 'else', 'for', 'while']
-
-        for i, line in enumerate(self.lines, 1):
-            stripped = line.strip()
-
-            for structure in control_structures:
-                pattern = rf'\b{structure}\s*\([^)]*\)\s*$'
-                if re.match(pattern, stripped):
-                    # Check next non-empty line
-                    for j in range(i, min(i + 3, len(self.lines))):
-                        if j < len(self.lines):
-                            next_line = self.lines[j].strip()
-                            if next_line and not next_line.startswith('//'):
-                                if not next_line.startswith('{'):
-                                    issues.append(f"Line {i}: {structure} statement might be missing braces")
-                                break
-
-        if issues:
-            self.warnings.extend([f"BRACE warning: {issue}" for issue in issues])
-        return len(issues) == 0
+        n = 0
 
-    def check_compilation(self):
-        """FLAGS: Check compilation with required flags"""
-        if not os.path.exists(self.filename):
-            return False
+        for i, stripped in enumerate(self._stripped, 1):
+            m = _CTRL_RE.match(stripped)
+            if not m:
+                continue
 
-        flags = ['-Wall', '-Wextra', '-Wfloat-equal', '-Wvla', '-pedantic', '-std=c99', '-g3']
-        cmd = ['gcc'] + flags + ['-c', self.filename, '-o', '/tmp/style_check.o']
+            # Check next non-empty line
+            for next_line in self._stripped[i:i + 3]:
+                if next_line and not next_line.startswith(b'//'):
+                    if not next_line.startswith(b'{'):
+                        self._raw.extend((_BRACE, i, 0, 0))
+                        n += 1
+                    break
+
+        return n == 0
+
+    def _start_compile(self):
+        """Start gcc on the file without waiting for it"""
+        # Only diagnostics matter, so don't generate (or clean up) an object file
+        cmd = ['gcc'] + _GCC_FLAGS + [self.filename]
+        return subprocess.Popen(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE,
+                                text=True, errors='replace')
+
+    @staticmethod
+    def _finish_compile(proc):
+        """Wait for a gcc started by _start_compile, returning (compiled, compiler output)"""
+        _, output = proc.communicate()
+        return proc.returncode == 0, output
+
+    def _compile(self):
+        """Run gcc on the file, returning (compiled, compiler output)"""
+        return self._finish_compile(self._start_compile())
 
-        try:
-            result = subprocess.run(cmd, capture_output=True, text=True)
-            if result.returncode != 0:
-                self.errors.append(f"FLAGS violation: Compilation failed with required flags")
-                self.errors.append(f"Compiler output: {result.stderr}")
+    def check_compilation(self):
+        """FLAGS: Check compilation with required flags"""
+        if self._compilation is None:
+            try:
+                self._compilation = self._compile()
+            except OSError:  # gcc missing or not runnable
+                self._raw.extend((_FLAGS_ERROR, 0, 0, 0))
                 return False
-            else:
-                # Clean up
-                if os.path.exists('/tmp/style_check.o'):
-                    os.remove('/tmp/style_check.o')
-                return True
-        except subprocess.CalledProcessError:
-            self.errors.append("FLAGS violation: Could not compile with required flags")
-            return False
 
-    def check_all(self):
-        """Run all automated checks"""
-        if not self.load_file():
-            return False
-
-        print(f"Checking {self.filename} against style guidelines...\n")
+        compiled, _ = self._compilation
+        if not compiled:
+            self._raw.extend((_FLAGS, 0, 0, 0, _FLAGS_OUTPUT, 0, 0, 0))
+        return compiled
+
+    def _run_checks(self, out):
+        """Run every check on the loaded file, appending a status row per check to out"""
+        # gcc is by far the slowest check, so start it first and do the regex
+        # checks while it compiles; FLAGS collects its output. A batch run has
+        # already compiled the file, so there's nothing to overlap.
+        proc = None
+        if self._compilation is None:
+            try:
+                proc = self._start_compile()
+            except OSError:
+                pass  # check_compilation runs gcc itself and reports the failure
 
-        if self.test_function_lines:
-            print(f"ℹ️  Skipping style checks for test functions (lines: {min(self.test_function_lines)}-{max(self.test_function_lines)})")
-            print()
+        def wait_and_check_compilation():
+            if proc is not None:
+                self._compilation = self._finish_compile(proc)
+            return self.check_compilation()
 
         checks = [
             ("TABS", self.check_tabs),
@@ -292,47 +532,162 @@ class StyleChecker:
             ("CAPS", self.check_constants_caps),
             ("RETV", self.check_unused_return_values),
             ("BRACE", self.check_braces),
-            ("FLAGS", self.check_compilation)
+            ("FLAGS", wait_and_check_compilation)
         ]
 
         passed = 0
         total = len(checks)
 
-        for name, check_func in checks:
-            try:
-                result = check_func()
-                status = "✅ PASS" if result else "❌ FAIL"
-                print(f"{name:8} {status}")
-                if result:
-                    passed += 1
-            except Exception as e:
-                print(f"{name:8} ❌ ERROR: {e}")
+        try:
+            for name, check_func in checks:
+                try:
+                    result = check_func()
+                    status = "✅ PASS" if result else "❌ FAIL"
+                    out.append(f"{name:8} {status}\n")
+                    if result:
+                        passed += 1
+                except Exception as e:
+                    out.append(f"{name:8} ❌ ERROR: {e}\n")
+        finally:
+            # Don't leave gcc running if a check was interrupted
+            if proc is not None and proc.poll() is None:
+                proc.kill()
+                proc.communicate()
+
+        return passed, total
+
+    def check_all(self):
+        """Run all automated checks"""
+        if not self.load_file():
+            return False
+
+        # Collect the report and write it in one go rather than a print per line
+        out = [f"Checking {self.filename} against style guidelines...\n\n"]
+
+        if self._test_starts:
+            out.append(f"ℹ️  Skipping style checks for test functions (lines: {self._test_starts[0]}-{self._test_ends[-1]})\n\n")
 
-        print(f"\n📊 Results: {passed}/{total} checks passed")
+        passed, total = self._run_checks(out)
+        out.append(f"\n📊 Results: {passed}/{total} checks passed\n")
 
-        if self.errors:
-            print(f"\n🔴 ERRORS ({len(self.errors)}):")
-            for error in self.errors:
-                print(f"  • {error}")
+        errors = self.errors
+        warnings = self.warnings
 
-        if self.warnings:
-            print(f"\n🟡 WARNINGS ({len(self.warnings)}):")
-            for warning in self.warnings:
-                print(f"  • {warning}")
+        if errors:
+            out.append(f"\n🔴 ERRORS ({len(errors)}):\n")
+            out.extend(f"  • {error}\n" for error in errors)
 
-        if not self.errors and not self.warnings:
-            print("\n🎉 All automated checks passed! Your code follows the style guidelines.")
+        if warnings:
+            out.append(f"\n🟡 WARNINGS ({len(warnings)}):\n")
+            out.extend(f"  • {warning}\n" for warning in warnings)
+
+        if not errors and not warnings:
+            out.append("\n🎉 All automated checks passed! Your code follows the style guidelines.\n")
+
+        sys.stdout.write(''.join(out))
+        return len(errors) == 0
+
+    @staticmethod
+    def _compile_batch(filenames):
+        """Syntax-check several files with one gcc run, returning (compiled, output) per file"""
+        cmd = ['gcc'] + _GCC_FLAGS + ['-fdiagnostics-format=json'] + list(filenames)
+
+        try:
+            result = subprocess.run(cmd, capture_output=True, text=True, errors='replace')
+            # gcc prints one JSON array per input file, in command-line order
+            reports = [json.loads(line) for line in result.stderr.splitlines() if line.startswith('[')]
+        except (OSError, ValueError):
+            return None
+
+        if len(reports) != len(filenames):
+            return None  # Let each file compile on its own instead
+
+        compilations = []
+        for diagnostics in reports:
+            compiled = all(d['kind'] in ('warning', 'note') for d in diagnostics)
+            output = '\n'.join(_format_diagnostic(d) for d in diagnostics)
+            compilations.append((compiled, output))
+        return compilations
+
+    @classmethod
+    def check_all_batch(cls, filenames):
+        """Run all automated checks on several files, compiling them together"""
+        checkers = [cls(filename) for filename in filenames]
+
+        compilations = cls._compile_batch(filenames)
+        if compilations is not None:
+            for checker, compilation in zip(checkers, compilations):
+                checker._batch_compilation = compilation
+
+        success = True
+        for n, checker in enumerate(checkers):
+            if n:
+                print()
+            success = checker.check_all() and success
+        return success
+
+    @classmethod
+    def cached_check(cls, path, cache_dir='~/.cache/style_checker'):
+        """Return (errors, warnings) for a file, reusing the last result if it hasn't changed
+
+        Nothing is printed. The cache key covers only the file itself, so a
+        cached FLAGS result goes stale if a header it includes changes.
+        """
+        # None (never a cached entry) means the file couldn't be read, which
+        # must not look like a file with no issues
+        try:
+            st = os.stat(path)
+        except OSError:
+            cls(path).load_file()  # Reports why the file can't be read
+            return None
+
+        abspath = os.path.abspath(path)
+        key = {
+            'path': abspath, 'mtime_ns': st.st_mtime_ns, 'size': st.st_size,
+            'version': _CACHE_VERSION, 'flags': _GCC_FLAGS,
+        }
+        cache_dir = os.path.expanduser(cache_dir)
+        cache_file = os.path.join(cache_dir, hashlib.sha1(os.fsencode(abspath)).hexdigest() + '.json')
+
+        try:
+            with open(cache_file) as f:
+                cached = json.load(f)
+            if cached['key'] == key:
+                return cached['errors'], cached['warnings']
+        except (OSError, ValueError, KeyError, TypeError):
+            pass  # No usable cache entry, so check the file again
+
+        checker = cls(path)
+        if not checker.load_file():
+            return None
+        checker._run_checks([])
+        errors = checker.errors
+        warnings = checker.warnings
+
+        # Caching is best effort; write to a temporary file so concurrent
+        # runs never see a partial entry
+        try:
+            os.makedirs(cache_dir, exist_ok=True)
+            tmp_file = f"{cache_file}.{os.getpid()}.tmp"
+            with open(tmp_file, 'w') as f:
+                json.dump({'key': key, 'errors': errors, 'warnings': warnings}, f)
+            os.replace(tmp_file, cache_file)
+        except OSError:
+            pass
 
-        return len(self.errors) == 0
+        return errors, warnings
 
 def main():
-    if len(sys.argv) != 2:
-        print("Usage: python3 style_checker.py <file.c>")
+    if len(sys.argv) < 2:
+        print("Usage: python3 style_checker.py <file.c> [<file.c> ...]")
         sys.exit(1)
 
-    filename = sys.argv[1]
-    checker = StyleChecker(filename)
-    success = checker.check_all()
+    filenames = sys.argv[1:]
+    if len(filenames) == 1:
+        checker = StyleChecker(filenames[0])
+        success = checker.check_all()
+    else:
+        success = StyleChecker.check_all_batch(filenames)
 
     sys.exit(0 if success else 1)
 